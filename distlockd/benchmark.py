@@ -9,11 +9,10 @@ This script can be imported and called from the CLI.
 import time
 import logging
 import threading
-import statistics
+import uuid
 
 import sys
 from concurrent.futures import ThreadPoolExecutor
-from queue import Queue
 
 try:
     import redis
@@ -22,11 +21,170 @@ except ImportError:
 
 try:
     from .client import Client as DistlockdClient
+    from .connection_pool import ConnectionPool
+    from .constants import CMD_ACQUIRE, CMD_RELEASE
 except ImportError:
     DistlockdClient = None
+    ConnectionPool = None
+
+NS_PER_MS = 1_000_000
+WARMUP_ITERATIONS = 50
+PIPELINE_DEPTH = 100
+P2_EXACT_SAMPLES = 500
+
+# Compare-and-delete, as used by redis-py's Lock.release
+REDIS_RELEASE_SCRIPT = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    return redis.call('del', KEYS[1])
+end
+return 0
+"""
+
+_RESULTS_TMPL = """
+# {backend} Benchmark Results
+
+
+# Test Parameters
+
+Iterations: {iterations}
+Number of clients: {num_clients}
+Number of locks: {num_locks}
+Throughput seconds: {throughput_seconds}
+
+# Results
+
+| Metric | Value |
+|--------|-------|
+| Latency Min (ms) | {latency[min]:.2f} |
+| Latency Max (ms) | {latency[max]:.2f} |
+| Latency Avg (ms) | {latency[avg]:.2f} |
+| 95th Percentile (ms) | {latency[p95]:.2f} |
+| 99th Percentile (ms) | {latency[p99]:.2f} |
+| Throughput (ops/sec) | {throughput:.2f} |
+| Pipelined Throughput (ops/sec) | {pipelined_throughput:.2f} |
+| Concurrency Success Rate (%) | {concurrency:.2f} |"""
+
+class P2Quantile:
+    """
+    Streaming quantile estimator using the P-square algorithm.
+
+    Tracks a single quantile in constant memory by maintaining five markers
+    whose heights are adjusted as samples arrive (Jain & Chlamtac, 1985).
+    The first ``exact_samples`` values are buffered and used for an exact
+    answer, since the markers need that many samples to converge; the
+    markers are then seeded from the buffer.
+    """
+    def __init__(self, q, exact_samples=P2_EXACT_SAMPLES):
+        """
+        Initialize the estimator.
+
+        Args:
+            q (float): The quantile to estimate, between 0 and 1.
+            exact_samples (int): Number of samples kept for an exact answer
+                before switching to the streaming estimate.
+        """
+        self.q = q
+        self.exact_samples = exact_samples
+        self.samples = []
+        self.heights = None
+        self.positions = None
+        self.desired = None
+        self.increments = [0, q / 2, q, (1 + q) / 2, 1]
+
+    def update(self, x):
+        """
+        Add a sample to the estimator.
+
+        Args:
+            x (float): The observed value.
+        """
+        if self.heights is None:
+            self.samples.append(x)
+            if len(self.samples) > self.exact_samples:
+                self._seed_markers()
+            return
+
+        heights = self.heights
+        if x < heights[0]:
+            heights[0] = x
+            k = 0
+        elif x >= heights[4]:
+            heights[4] = x
+            k = 3
+        else:
+            k = 0
+            while x >= heights[k + 1]:
+                k += 1
+
+        positions = self.positions
+        for i in range(k + 1, 5):
+            positions[i] += 1
+        for i in range(5):
+            self.desired[i] += self.increments[i]
+
+        for i in range(1, 4):
+            d = self.desired[i] - positions[i]
+            if ((d >= 1 and positions[i + 1] - positions[i] > 1)
+                    or (d <= -1 and positions[i - 1] - positions[i] < -1)):
+                d = 1 if d > 0 else -1
+                height = self._parabolic(i, d)
+                if not heights[i - 1] < height < heights[i + 1]:
+                    height = self._linear(i, d)
+                heights[i] = height
+                positions[i] += d
+
+    def _seed_markers(self):
+        """
+        Place the five markers on the buffered samples and drop the buffer.
+        """
+        samples = sorted(self.samples)
+        last = len(samples) - 1
+        self.desired = [f * last for f in self.increments]
+        positions = [round(d) for d in self.desired]
+        # Markers must sit on distinct, increasing positions
+        for i in range(1, 5):
+            positions[i] = max(positions[i], positions[i - 1] + 1)
+        for i in range(3, -1, -1):
+            positions[i] = min(positions[i], positions[i + 1] - 1)
+        self.positions = positions
+        self.heights = [samples[p] for p in positions]
+        self.samples = None
+
+    def _parabolic(self, i, d):
+        """
+        Piecewise-parabolic prediction of marker ``i`` moved by ``d``.
+        """
+        q, n = self.heights, self.positions
+        return q[i] + d / (n[i + 1] - n[i - 1]) * (
+            (n[i] - n[i - 1] + d) * (q[i + 1] - q[i]) / (n[i + 1] - n[i])
+            + (n[i + 1] - n[i] - d) * (q[i] - q[i - 1]) / (n[i] - n[i - 1])
+        )
+
+    def _linear(self, i, d):
+        """
+        Linear prediction of marker ``i`` moved by ``d``, used when the
+        parabolic one would break marker ordering.
+        """
+        q, n = self.heights, self.positions
+        return q[i] + d * (q[i + d] - q[i]) / (n[i + d] - n[i])
+
+    def value(self):
+        """
+        Return the current estimate of the quantile.
+        """
+        if self.heights is not None:
+            return self.heights[2]
+        if not self.samples:
+            raise ValueError("No samples recorded")
+        # Exact quantile with linear interpolation between closest ranks
+        samples = sorted(self.samples)
+        pos = self.q * (len(samples) - 1)
+        lower = int(pos)
+        upper = min(lower + 1, len(samples) - 1)
+        return samples[lower] + (samples[upper] - samples[lower]) * (pos - lower)
 
 class BenchmarkRunner:
-    def __init__(self, backend, host, port, iterations=1000, num_clients=100, num_locks=10, throughput_seconds=10, verbose=False):
+    def __init__(self, backend, host, port, iterations=1000, num_clients=100, num_locks=10, throughput_seconds=10, verbose=False, unix_path=None):
         """
         Initialize the benchmark runner.
 
@@ -39,6 +197,7 @@ class BenchmarkRunner:
             num_locks (int): The number of locks to test.
             throughput_seconds (int): The number of seconds to run the throughput test.
             verbose (bool): Whether to print verbose logging.
+            unix_path (str): Unix socket path of a local distlockd server.
         """
         self.backend = backend
         self.host = host
@@ -62,6 +221,14 @@ class BenchmarkRunner:
             self.logger.error('distlockd is not installed or not importable')
             sys.exit(1)
 
+        # Shared by every distlockd client so sockets are reused across
+        # iterations and worker threads instead of reconnecting each time.
+        self._pool = None
+        if unix_path and backend != 'distlockd':
+            self.logger.warning(f"Ignoring unix_path {unix_path}: only the distlockd backend supports it")
+        if backend == 'distlockd':
+            self._pool = ConnectionPool(host, port, max_connections=num_clients, unix_path=unix_path)
+
         try:
             _ = self._get_client()
         except Exception as e:
@@ -78,7 +245,7 @@ class BenchmarkRunner:
                 raise ConnectionError(f"Failed to connect to Redis server at {self.host}:{self.port}")
             return client
         elif self.backend == 'distlockd':
-            client = DistlockdClient(self.host, self.port, verbose=self.verbose)
+            client = DistlockdClient(self.host, self.port, verbose=self.verbose, pool=self._pool)
             if not client.check_server_health():
                 raise ConnectionError(f"Failed to connect to distlockd server at {self.host}:{self.port}")
             return client
@@ -86,86 +253,205 @@ class BenchmarkRunner:
             self.logger.error('Unknown backend')
             sys.exit(1)
 
+    def _warmup(self, client, lock, lock_name):
+        """
+        Run untimed acquire/release pairs so connection setup and first-call
+        costs stay out of the measured window.
+
+        Args:
+            client: The backend client to warm up.
+            lock: The redis lock object, or None for distlockd.
+            lock_name (str): The lock name to cycle.
+        """
+        for _ in range(WARMUP_ITERATIONS):
+            try:
+                if self.backend == 'redis':
+                    if lock.acquire(blocking=True, blocking_timeout=0.5):
+                        lock.release()
+                else:
+                    if client.acquire(lock_name, timeout=0.5):
+                        client.release(lock_name)
+            except Exception as e:
+                self.logger.debug(f"Error in warmup: {e}")
+
     def measure_latency(self):
         """
         Measure the latency of the specified backend.
+
+        Samples are taken with ``time.perf_counter_ns`` and only converted
+        to milliseconds once the loop has finished. Percentiles are
+        estimated on the fly, so memory use does not grow with iterations.
         """
-        latencies = []
+        count = 0
+        total = 0
+        min_latency = None
+        max_latency = None
+        p95 = P2Quantile(0.95)
+        p99 = P2Quantile(0.99)
+        client = self._get_client()
+        # Reuse one lock so every sample measures the same steady-state path
+        lock_name = "latency-probe"
+        lock = None
+        if self.backend == 'redis':
+            lock = client.lock(lock_name, timeout=10)
+        self._warmup(client, lock, lock_name)
         for i in range(self.iterations):
-            lock_name = f"test-lock-{i}"
-            start = time.time()
+            start = time.perf_counter_ns()
             try:
                 if self.backend == 'redis':
-                    client = self._get_client()
-                    lock = client.lock(lock_name, timeout=10)
                     acquired = lock.acquire(blocking=True, blocking_timeout=0.5)
                     if acquired:
-                        latency = (time.time() - start) * 1000
-                        latencies.append(latency)
+                        latency = time.perf_counter_ns() - start
                         lock.release()
                 else:
-                    client = self._get_client()
                     acquired = client.acquire(lock_name, timeout=0.5)
                     if acquired:
-                        latency = (time.time() - start) * 1000
-                        latencies.append(latency)
+                        latency = time.perf_counter_ns() - start
                         client.release(lock_name)
+                if acquired:
+                    count += 1
+                    total += latency
+                    if min_latency is None or latency < min_latency:
+                        min_latency = latency
+                    if max_latency is None or latency > max_latency:
+                        max_latency = latency
+                    p95.update(latency)
+                    p99.update(latency)
             except Exception as e:
                 self.logger.error(f"Error in iteration {i}: {e}")
                 continue
-        if not latencies:
+        if not count:
             self.logger.error("No successful operations recorded")
             sys.exit(1)
         return {
-            'min': min(latencies),
-            'max': max(latencies),
-            'avg': statistics.mean(latencies),
-            'p95': statistics.quantiles(sorted(latencies), n=20)[-1],
-            'p99': statistics.quantiles(sorted(latencies), n=100)[-1],
+            'min': min_latency / NS_PER_MS,
+            'max': max_latency / NS_PER_MS,
+            'avg': total / count / NS_PER_MS,
+            'p95': p95.value() / NS_PER_MS,
+            'p99': p99.value() / NS_PER_MS,
         }
 
-    def measure_throughput(self):
+    def _throughput_cycle(self, client, lock_name, pipelined):
+        """
+        Build the unit of work one throughput worker repeats.
+
+        Args:
+            client: The backend client owned by the worker.
+            lock_name (str): A lock name unique to the worker.
+            pipelined (bool): Whether to batch ``PIPELINE_DEPTH`` acquires,
+                then the matching releases, into one round trip each.
+
+        Returns:
+            callable: Runs one batch and returns the completed acquire/release
+            pairs.
+        """
+        if not pipelined:
+            if self.backend == 'redis':
+                lock = client.lock(lock_name, timeout=10)
+                def cycle():
+                    ops = 0
+                    for _ in range(PIPELINE_DEPTH):
+                        if lock.acquire(blocking=True, blocking_timeout=0.5):
+                            lock.release()
+                            ops += 1
+                    return ops
+            else:
+                def cycle():
+                    ops = 0
+                    for _ in range(PIPELINE_DEPTH):
+                        if client.acquire(lock_name, timeout=0.5):
+                            client.release(lock_name)
+                            ops += 1
+                    return ops
+            return cycle
+
+        names = [f"{lock_name}-{j}" for j in range(PIPELINE_DEPTH)]
+        if self.backend == 'redis':
+            # Same semantics as redis-py's Lock: SET NX with a 10 s expiry,
+            # released by a script that checks the owner token
+            token = str(uuid.uuid4())
+            # Loaded once up front: queuing a Script object would make every
+            # execute() send an extra SCRIPT EXISTS round trip first
+            release_sha = client.script_load(REDIS_RELEASE_SCRIPT)
+            pipe = client.pipeline(transaction=False)
+            def cycle():
+                for name in names:
+                    pipe.set(name, token, nx=True, px=10000)
+                acquired = [name for name, ok in zip(names, pipe.execute()) if ok]
+                if not acquired:
+                    return 0
+                for name in acquired:
+                    pipe.evalsha(release_sha, 1, name, token)
+                return sum(pipe.execute())
+        else:
+            # Encode the fixed batches once rather than on every cycle
+            acquire_payload = client.pack_batch(CMD_ACQUIRE, names)
+            release_payload = client.pack_batch(CMD_RELEASE, names)
+            def cycle():
+                results = client.acquire_many(names, acquire_payload)
+                if all(results):
+                    return sum(client.release_many(names, release_payload))
+                acquired = [name for name, ok in zip(names, results) if ok]
+                if not acquired:
+                    return 0
+                return sum(client.release_many(acquired))
+        return cycle
+
+    def measure_throughput(self, pipelined=False):
         """
         Measure the throughput of the specified backend.
+
+        Workers connect and run one untimed batch first, then wait on a
+        barrier so the timed window only covers steady-state operations.
+
+        Args:
+            pipelined (bool): Batch ``PIPELINE_DEPTH`` operations per round
+                trip instead of waiting for each reply. Both backends use an
+                equivalent pipeline, so the results stay comparable.
         """
-        stop_event = threading.Event()
-        ops_queue = Queue()
+        num_threads = 10
+        start_barrier = threading.Barrier(num_threads + 1)
+        # Plain flag rather than threading.Event: workers only poll it, and
+        # reading a list item is atomic under the GIL without taking a lock.
+        stop = [False]
         def worker():
-            client = self._get_client()
+            try:
+                client = self._get_client()
+                lock_name = f"test-lock-{threading.get_ident()}"
+                cycle = self._throughput_cycle(client, lock_name, pipelined)
+                # Warm up the exact path that is about to be timed
+                cycle()
+            except BaseException as e:
+                self.logger.error(f"Error setting up throughput worker: {e}")
+                # Release the other workers and the timer instead of hanging
+                start_barrier.abort()
+                raise
+            try:
+                start_barrier.wait()
+            except threading.BrokenBarrierError:
+                return 0  # Another worker failed during setup
             ops = 0
-            lock_name = f"test-lock-{threading.get_ident()}"
-            if self.backend == 'redis':
-                lock = client.lock(lock_name, timeout=10)
-            while not stop_event.is_set():
+            while not stop[0]:
                 try:
-                    for _ in range(100):
-                        if self.backend == 'redis':
-                            acquired = lock.acquire(blocking=True, blocking_timeout=0.5)
-                            if acquired:
-                                lock.release()
-                                ops += 1
-                        else:
-                            acquired = client.acquire(lock_name, timeout=0.5)
-                            if acquired:
-                                client.release(lock_name)
-                                ops += 1
+                    ops += cycle()
                 except Exception as e:
                     self.logger.error(f"Error in worker: {e}")
                     continue
-            ops_queue.put(ops)
-        threads = []
-        for _ in range(10):
-            t = threading.Thread(target=worker)
-            t.daemon = True
-            t.start()
-            threads.append(t)
-        time.sleep(self.throughput_seconds)
-        stop_event.set()
-        total_ops = 0
-        for _ in range(10):
-            total_ops += ops_queue.get()
-        for t in threads:
-            t.join()
+            return ops
+        with ThreadPoolExecutor(max_workers=num_threads) as executor:
+            futures = [executor.submit(worker) for _ in range(num_threads)]
+            try:
+                start_barrier.wait()
+            except threading.BrokenBarrierError:
+                pass  # A worker failed during setup; reported below
+            else:
+                time.sleep(self.throughput_seconds)
+            stop[0] = True
+        errors = [f.exception() for f in futures if f.exception() is not None]
+        if errors:
+            self.logger.error(f"Throughput test failed: {errors[0]}")
+            sys.exit(1)
+        total_ops = sum(f.result() for f in futures)
         return total_ops / self.throughput_seconds
 
     def test_concurrent_clients(self):
@@ -191,8 +477,9 @@ class BenchmarkRunner:
                     return True
             except Exception:
                 return False
+        lock_names = tuple(f"concurrent-lock-{i}" for i in range(self.num_locks))
         work_items = [
-            (i, f"concurrent-lock-{i % self.num_locks}")
+            (i, lock_names[i % self.num_locks])
             for i in range(self.num_clients)
         ]
         with ThreadPoolExecutor(max_workers=self.num_clients) as executor:
@@ -209,31 +496,27 @@ class BenchmarkRunner:
         print("Latency test completed")
         throughput = self.measure_throughput()
         print("Throughput test completed")
+        pipelined_throughput = self.measure_throughput(pipelined=True)
+        print("Pipelined throughput test completed")
         concurrency = self.test_concurrent_clients()
         print("Concurrency test completed")
         results = {
             'latency': latency,
             'throughput': throughput,
+            'pipelined_throughput': pipelined_throughput,
             'concurrency': concurrency
         }
         self.print_results(results)
 
     def print_results(self, results):
-        print(f"\n# {self.backend.capitalize()} Benchmark Results\n")
-        print("\n# Test Parameters\n")
-        print(f"Iterations: {self.iterations}")
-        print(f"Number of clients: {self.num_clients}")
-        print(f"Number of locks: {self.num_locks}")
-        print(f"Throughput seconds: {self.throughput_seconds}")
-        print("\n# Results\n")
-
-        print("| Metric | Value |")
-        print("|--------|-------|")
-        latency = results['latency']
-        print(f"| Latency Min (ms) | {latency['min']:.2f} |")
-        print(f"| Latency Max (ms) | {latency['max']:.2f} |")
-        print(f"| Latency Avg (ms) | {latency['avg']:.2f} |")
-        print(f"| 95th Percentile (ms) | {latency['p95']:.2f} |")
-        print(f"| 99th Percentile (ms) | {latency['p99']:.2f} |")
-        print(f"| Throughput (ops/sec) | {results['throughput']:.2f} |")
-        print(f"| Concurrency Success Rate (%) | {results['concurrency']:.2f} |")
+        print(_RESULTS_TMPL.format_map({
+            'backend': self.backend.capitalize(),
+            'iterations': self.iterations,
+            'num_clients': self.num_clients,
+            'num_locks': self.num_locks,
+            'throughput_seconds': self.throughput_seconds,
+            'latency': results['latency'],
+            'throughput': results['throughput'],
+            'pipelined_throughput': results['pipelined_throughput'],
+            'concurrency': results['concurrency'],
+        }))
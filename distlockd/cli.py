@@ -45,6 +45,12 @@ def parse_args():
         action='store_true',
         help='Enable verbose logging'
     )
+    server_parser.add_argument(
+        '--unix-path',
+        type=str,
+        default=None,
+        help='Also listen on this unix socket path (default: disabled)'
+    )
 
     # Benchmark/test command
     test_parser = subparsers.add_parser('test', help='Run distlockd/redis benchmarks')
@@ -56,6 +62,7 @@ def parse_args():
     test_parser.add_argument('--num-locks', type=int, default=10, help='Number of locks for concurrency test')
     test_parser.add_argument('--throughput-seconds', type=int, default=10, help='Seconds for throughput test')
     test_parser.add_argument('--verbose', action='store_true', help='Enable verbose logging')
+    test_parser.add_argument('--unix-path', type=str, help='Unix socket path of a local distlockd server')
 
     return parser.parse_args()
 
@@ -76,8 +83,23 @@ def main():
             signal.signal(signal.SIGINT, handle_signal)
             signal.signal(signal.SIGTERM, handle_signal)
 
+            # Use uvloop's faster event loop when it is installed
+            try:
+                import uvloop
+            except ImportError:
+                uvloop = None
+
             # Run the server
-            asyncio.run(server_main(args.host, args.port, verbose=args.verbose))
+            server = server_main(args.host, args.port, verbose=args.verbose, unix_path=args.unix_path)
+            if uvloop is None:
+                asyncio.run(server)
+            elif sys.version_info >= (3, 11):
+                with asyncio.Runner(loop_factory=uvloop.new_event_loop) as runner:
+                    runner.run(server)
+            else:
+                # Event loop policies are deprecated; only older interpreters need this
+                uvloop.install()
+                asyncio.run(server)
         except KeyboardInterrupt:
             print("Server stopped by user")
         except Exception as e:
@@ -91,7 +113,8 @@ def main():
             'num_clients': args.num_clients,
             'num_locks': args.num_locks,
             'throughput_seconds': args.throughput_seconds,
-            'verbose': args.verbose
+            'verbose': args.verbose,
+            'unix_path': args.unix_path
         }
         runner = BenchmarkRunner(args.backend, host, port, **bench_args)
         runner.run_all()
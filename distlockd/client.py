@@ -6,10 +6,10 @@ Client for the distlockd lock server.
 import uuid
 import logging
 import time
-import struct
-from typing import Optional, Any
+from typing import Optional, Any, Callable, List
 from contextlib import contextmanager
 import socket
+import threading
 
 from .exceptions import (
     LockAcquisitionTimeout,
@@ -17,7 +17,7 @@ from .exceptions import (
     ServerError,
     ConnectionError
 )
-from .protocol import BinaryProtocol
+from .protocol import BinaryProtocol, RESP_STRUCT
 from .connection_pool import ConnectionPool
 
 from .constants import (
@@ -32,8 +32,8 @@ from .constants import (
     DEFAULT_RETRY_COUNT,
     DEFAULT_RETRY_DELAY,
     DEFAULT_TIMEOUT,
-    RESP_FORMAT,
-    RESP_HEADER_SIZE
+    RESP_HEADER_SIZE,
+    RECV_BUFFER_SIZE
 )
 
 logging.basicConfig(
@@ -105,7 +105,9 @@ class Client:
         connect_timeout: float = DEFAULT_RETRY_DELAY,
         operation_timeout: float = DEFAULT_TIMEOUT,
         pool_size: int = MAX_CONNECTIONS,
-        verbose: bool = False
+        verbose: bool = False,
+        pool: Optional[ConnectionPool] = None,
+        unix_path: Optional[str] = None
     ) -> None:
         self.host = host
         self.port = port
@@ -113,39 +115,33 @@ class Client:
         self.connect_timeout = connect_timeout
         self.operation_timeout = operation_timeout
         self.client_id = str(uuid.uuid4())
-        self._pool = ConnectionPool(host, port, pool_size)
+        self.current_lock = None
+        self._local = threading.local()
+        self._pool = pool if pool is not None else ConnectionPool(host, port, pool_size, unix_path)
         if verbose:
             logger.setLevel(logging.DEBUG)
         logger.debug(f"Initialized client {self.client_id} for {host}:{port}")
 
-    def _send_binary(self, cmd_type: int, name: str) -> tuple[int, str]:
-        """Send a binary command to the server with retry logic and pooling."""
+    def _rxbuf(self) -> memoryview:
+        """Return this thread's receive buffer, allocating it on first use."""
+        try:
+            return self._local.rxbuf
+        except AttributeError:
+            self._local.rxbuf = memoryview(bytearray(RECV_BUFFER_SIZE))
+            return self._local.rxbuf
+
+    def _with_connection(self, exchange: Callable[[socket.socket], Any]) -> Any:
+        """Run a request/response exchange on a pooled socket with retry logic."""
         retries = self.retry_count
         last_error = None
 
         for attempt in range(retries):
             sock = None
             try:
-                # Pack command
-                cmd = BinaryProtocol.pack_command(cmd_type, name, self.client_id)
-
-                # Send command
                 sock = self._pool.get()
-                sock.sendall(cmd)
-
-                # Read response header (3 bytes: status + msg_len)
-                header = sock.recv(RESP_HEADER_SIZE)
-                if len(header) < RESP_HEADER_SIZE:
-                    raise ServerError("Incomplete response header")
-                status, msg_len = struct.unpack(RESP_FORMAT, header)
-                # Read message if any
-                message = b''
-                if msg_len > 0:
-                    message = sock.recv(msg_len)
-                    if len(message) < msg_len:
-                        raise ServerError("Incomplete response message")
+                result = exchange(sock)
                 self._pool.put(sock)
-                return status, message.decode('utf-8') if message else ''
+                return result
 
             except (socket.timeout, socket.error, ServerError) as e:
                 last_error = e
@@ -169,6 +165,84 @@ class Client:
             cause=str(last_error)
         )
 
+    def _send_binary(self, cmd_type: int, name: str) -> tuple[int, str]:
+        """Send a binary command to the server with retry logic and pooling."""
+        # Pack command
+        cmd = BinaryProtocol.pack_command(cmd_type, name, self.client_id)
+
+        def exchange(sock: socket.socket) -> tuple[int, str]:
+            # Send command
+            sock.sendall(cmd)
+
+            # Read into a reusable per-thread buffer to avoid allocating
+            # a bytes object for every response
+            rxbuf = self._rxbuf()
+
+            # Read response header (3 bytes: status + msg_len)
+            if sock.recv_into(rxbuf, RESP_HEADER_SIZE) < RESP_HEADER_SIZE:
+                raise ServerError("Incomplete response header")
+            status, msg_len = RESP_STRUCT.unpack_from(rxbuf)
+            # Read message if any
+            message = ''
+            if msg_len > 0:
+                if msg_len > len(rxbuf):
+                    rxbuf = memoryview(bytearray(msg_len))
+                if sock.recv_into(rxbuf, msg_len) < msg_len:
+                    raise ServerError("Incomplete response message")
+                message = str(rxbuf[:msg_len], 'utf-8')
+            return status, message
+
+        return self._with_connection(exchange)
+
+    def _send_pipelined(
+        self, cmd_type: int, names: List[str], payload: Optional[bytes] = None
+    ) -> List[tuple[int, str]]:
+        """Send one command per name in a single write, then read all responses.
+
+        The server answers requests on a connection in order, so the whole
+        batch costs one round trip instead of one per name. If the
+        connection fails partway, only the commands still unanswered are
+        retried. Those may already have been applied by the server before
+        the failure, in which case a retried release reports False.
+
+        ``payload`` may carry the batch already encoded by ``pack_batch``;
+        it is only used while no response has been received.
+        """
+        count = len(names)
+        # Kept across retries so answered commands are never sent twice
+        responses = []
+
+        def exchange(sock: socket.socket) -> List[tuple[int, str]]:
+            if payload is not None and not responses:
+                sock.sendall(payload)
+            else:
+                pending = names[len(responses):]
+                sock.sendall(BinaryProtocol.pack_commands(cmd_type, pending, self.client_id))
+
+            rxbuf = self._rxbuf()
+            data = bytearray()
+            offset = 0
+            while True:
+                # Consume every complete response received so far
+                while len(responses) < count and len(data) - offset >= RESP_HEADER_SIZE:
+                    status, msg_len = RESP_STRUCT.unpack_from(data, offset)
+                    end = offset + RESP_HEADER_SIZE + msg_len
+                    if len(data) < end:
+                        break
+                    message = data[offset + RESP_HEADER_SIZE:end].decode('utf-8') if msg_len else ''
+                    responses.append((status, message))
+                    offset = end
+                if len(responses) >= count:
+                    return responses
+                received = sock.recv_into(rxbuf)
+                if not received:
+                    raise ServerError(
+                        f"Incomplete pipelined response: got {len(responses)} of {count}"
+                    )
+                data += rxbuf[:received]
+
+        return self._with_connection(exchange)
+
     def check_server_health(self) -> bool:
         """Check if server is responding."""
         try:
@@ -243,6 +317,68 @@ class Client:
                 f"Error releasing lock {name}, error: {e}"
             )
 
+    def pack_batch(self, cmd_type: int, names: List[str]) -> bytes:
+        """Encode a pipelined batch once, for reuse with ``acquire_many``/``release_many``.
+
+        Args:
+            cmd_type: ``CMD_ACQUIRE`` or ``CMD_RELEASE``.
+            names: Names of the locks in the batch.
+
+        Returns:
+            bytes: The encoded commands, valid only for this client.
+        """
+        return BinaryProtocol.pack_commands(cmd_type, names, self.client_id)
+
+    def acquire_many(self, names: List[str], payload: Optional[bytes] = None) -> List[bool]:
+        """Try to acquire several locks in one pipelined round trip.
+
+        Unlike ``acquire``, busy locks are not retried.
+
+        Args:
+            names: Names of the locks to acquire.
+            payload: Optional result of ``pack_batch(CMD_ACQUIRE, names)``,
+                so a repeated batch is not re-encoded on every call.
+
+        Returns:
+            List[bool]: For each name, True if the lock was acquired.
+        """
+        if not all(names):
+            raise ValueError("Lock name cannot be empty")
+        if not names:
+            return []
+
+        results = []
+        for name, (status, _) in zip(names, self._send_pipelined(CMD_ACQUIRE, names, payload)):
+            if status == RESP_OK:
+                results.append(True)
+            elif status == RESP_TIMEOUT:
+                results.append(False)
+            else:
+                raise ServerError(f"Unexpected response from server: {status}")
+        logger.debug(f"Acquired {sum(results)} of {len(names)} locks")
+        return results
+
+    def release_many(self, names: List[str], payload: Optional[bytes] = None) -> List[bool]:
+        """Release several locks in one pipelined round trip.
+
+        Args:
+            names: Names of the locks to release.
+            payload: Optional result of ``pack_batch(CMD_RELEASE, names)``.
+
+        Returns:
+            List[bool]: For each name, True if the lock was released.
+        """
+        if not names:
+            return []
+
+        results = [status == RESP_OK for status, _ in self._send_pipelined(CMD_RELEASE, names, payload)]
+        for name, released in zip(names, results):
+            # If this was our current lock, clear it
+            if released and self.current_lock == name:
+                self.current_lock = None
+        logger.debug(f"Released {sum(results)} of {len(names)} locks")
+        return results
+
     @contextmanager
     def lock(self, name: str, timeout: Optional[float] = None) -> Any:
         """Context manager for acquiring and releasing a lock."""
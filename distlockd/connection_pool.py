@@ -9,15 +9,21 @@ frequently.
 
 """
 
+import logging
 import socket
 import threading
+from collections import deque
+from typing import Optional
 
 from .constants import (
     DEFAULT_HOST,
     DEFAULT_PORT,
-    MAX_CONNECTIONS
+    MAX_CONNECTIONS,
+    LOCAL_HOSTS
 )
 
+logger = logging.getLogger(__name__)
+
 class ConnectionPool:
     """
     Manages a pool of connections to a server.
@@ -32,21 +38,32 @@ class ConnectionPool:
         ``distlockd.constants.DEFAULT_PORT``.
     :param max_connections: Maximum number of connections in the pool.
         Defaults to ``distlockd.constants.MAX_CONNECTIONS``.
+    :param unix_path: Path of the server's unix socket. When set and
+        ``host`` is local, connections bypass the TCP loopback stack.
     """
 
-    def __init__(self, host: str=DEFAULT_HOST, port: int=DEFAULT_PORT, max_connections: int=MAX_CONNECTIONS):
+    def __init__(self, host: str=DEFAULT_HOST, port: int=DEFAULT_PORT, max_connections: int=MAX_CONNECTIONS,
+                 unix_path: Optional[str]=None):
         """
         Initializes the connection pool.
 
         :param host: Hostname or IP address of the server.
         :param port: Port number of the server.
         :param max_connections: Maximum number of connections in the pool.
+        :param unix_path: Path of the server's unix socket, if any.
         """
         self.host = host
         self.port = port
         self.max_connections = max_connections
-        self.connections = []
-        self.lock = threading.Lock()
+        self.unix_path = unix_path if host in LOCAL_HOSTS else None
+        if unix_path and not self.unix_path:
+            logger.warning(
+                f"Ignoring unix_path {unix_path}: host {host} is not local, using TCP"
+            )
+        # Single-item append/popleft on a deque are atomic, so the hot path
+        # needs no lock; only close_all takes one to drain the pool.
+        self._pool = deque()
+        self._close_lock = threading.Lock()
 
     def get(self):
         """
@@ -56,31 +73,46 @@ class ConnectionPool:
         maximum number of connections has been reached, a ``ConnectionError`` is
         raised.
         """
-        with self.lock:
-            if self.connections:
-                return self.connections.pop()
-            else:
-                try:
-                    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-                    sock.connect((self.host, self.port))
-                    return sock
-                except Exception as e:
-                    raise ConnectionError(f"Error creating connection: {e}")
+        try:
+            return self._pool.popleft()
+        except IndexError:
+            pass
+        try:
+            if self.unix_path:
+                sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+                sock.connect(self.unix_path)
+                return sock
+            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            sock.connect((self.host, self.port))
+            # Lock requests are tiny; don't let Nagle hold them back
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+            return sock
+        except Exception as e:
+            raise ConnectionError(f"Error creating connection: {e}")
 
     def put(self, sock):
         """
         Returns a connection to the pool.
 
+        If the pool already holds ``max_connections`` idle connections, the
+        socket is closed instead.
+
         :param sock: Socket to return to the pool.
         """
-        with self.lock:
-            self.connections.append(sock)
+        if len(self._pool) >= self.max_connections:
+            sock.close()
+            return
+        self._pool.append(sock)
 
     def close_all(self):
         """
         Closes all connections in the pool.
         """
-        with self.lock:
-            for sock in self.connections:
-                sock.close()
-            self.connections = []
\ No newline at end of file
+        with self._close_lock:
+            while True:
+                try:
+                    sock = self._pool.popleft()
+                except IndexError:
+                    break
+                sock.close()
\ No newline at end of file
@@ -12,6 +12,8 @@ DEFAULT_RETRY_COUNT: Final = 3
 DEFAULT_RETRY_DELAY: Final = 0.5
 STALE_LOCK_TIMEOUT: Final = 3600  # seconds
 MAX_CONNECTIONS: Final = multiprocessing.cpu_count() * 2 # int
+RECV_BUFFER_SIZE: Final = 4096  # bytes preallocated per thread for responses
+LOCAL_HOSTS: Final = ("127.0.0.1", "localhost", "::1")  # hosts eligible for a unix socket
 
 # Protocol constants
 CMD_ACQUIRE = 0x01
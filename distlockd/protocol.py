@@ -3,49 +3,74 @@ Protocol handlers for distlockd server commands.
 """
 import logging
 import struct
-from typing import Tuple
+from functools import lru_cache
+from typing import Sequence, Tuple
 
 from .constants import CMD_FORMAT, RESP_FORMAT, CMD_HEADER_SIZE, RESP_HEADER_SIZE
 
 logger = logging.getLogger(__name__)
 
+# Precompiled so the format strings are parsed once rather than per message
+CMD_STRUCT = struct.Struct(CMD_FORMAT)
+RESP_STRUCT = struct.Struct(RESP_FORMAT)
+
+def _encode_command(cmd_type: int, name: str, client_id: str) -> bytes:
+    """Encode a single command without going through any cache."""
+    name_bytes = name.encode('utf-8')
+    client_id_bytes = client_id.encode('utf-8')
+    header = CMD_STRUCT.pack(  # network byte order, unsigned char + 2 unsigned shorts
+        cmd_type,
+        len(name_bytes),
+        len(client_id_bytes)
+    )
+    return header + name_bytes + client_id_bytes
+
 class BinaryProtocol:
     """Binary protocol for client-server communication."""
     @staticmethod
+    @lru_cache(maxsize=1024)
     def pack_command(cmd_type: int, name: str, client_id: str) -> bytes:
         """Pack a command into binary format.
         Format: <cmd_type:1><name_len:2><client_id_len:2><name><client_id>
+
+        Results are cached, so repeated commands for the same lock and
+        client reuse the already encoded payload.
+        """
+        return _encode_command(cmd_type, name, client_id)
+
+    @staticmethod
+    def pack_commands(cmd_type: int, names: Sequence[str], client_id: str) -> bytes:
+        """Pack one command per name into a single pipelined payload.
+
+        Not cached: batches can be arbitrarily large. Callers repeating the
+        same batch should keep the returned payload themselves.
         """
-        name_bytes = name.encode('utf-8')
-        client_id_bytes = client_id.encode('utf-8')
-        header = struct.pack(
-            CMD_FORMAT,  # network byte order, unsigned char + 2 unsigned shorts
-            cmd_type,
-            len(name_bytes),
-            len(client_id_bytes)
-        )
-        return header + name_bytes + client_id_bytes
+        return b''.join(_encode_command(cmd_type, name, client_id) for name in names)
 
     @staticmethod
     def unpack_command(data: bytes) -> Tuple[int, str, str]:
         """Unpack a binary command."""
-        cmd_type, name_len, client_id_len = struct.unpack(CMD_FORMAT, data[:CMD_HEADER_SIZE])
+        cmd_type, name_len, client_id_len = CMD_STRUCT.unpack_from(data)
         name = data[CMD_HEADER_SIZE:CMD_HEADER_SIZE+name_len].decode('utf-8')
         client_id = data[CMD_HEADER_SIZE+name_len:CMD_HEADER_SIZE+name_len+client_id_len].decode('utf-8')
         return cmd_type, name, client_id
 
     @staticmethod
+    @lru_cache(maxsize=64)
     def pack_response(status: int, message: str = '') -> bytes:
         """Pack a response into binary format.
         Format: <status:1><msg_len:2><message>
+
+        The server only sends a handful of distinct responses, so results
+        are cached.
         """
         message_bytes = message.encode('utf-8') if message else b''
-        header = struct.pack(RESP_FORMAT, status, len(message_bytes))
+        header = RESP_STRUCT.pack(status, len(message_bytes))
         return header + message_bytes
 
     @staticmethod
     def unpack_response(data: bytes) -> Tuple[int, str]:
         """Unpack a binary response."""
-        status, msg_len = struct.unpack(RESP_FORMAT, data[:RESP_HEADER_SIZE])
+        status, msg_len = RESP_STRUCT.unpack_from(data)
         message = data[RESP_HEADER_SIZE:RESP_HEADER_SIZE+msg_len].decode('utf-8') if msg_len > 0 else ''
         return status, message
\ No newline at end of file
@@ -1,12 +1,12 @@
 import asyncio
 import time
 import logging
+import os
 import signal
-import struct
 import sys
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 
-from .protocol import BinaryProtocol
+from .protocol import BinaryProtocol, CMD_STRUCT
 
 from .constants import (
     CMD_ACQUIRE,
@@ -17,7 +17,6 @@ from .constants import (
     RESP_TIMEOUT,
     RESP_INVALID,
     STALE_LOCK_TIMEOUT,
-    CMD_FORMAT,
     CMD_HEADER_SIZE
 )
 
@@ -62,7 +61,8 @@ async def cleanup_stale_locks() -> None:
 
 async def handle_client(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
     """Handle client connections and lock operations."""
-    peer = writer.get_extra_info('peername')
+    # Unix socket peers are unnamed, so label them by the listening path
+    peer = writer.get_extra_info('peername') or f"unix:{writer.get_extra_info('sockname')}"
     logger.info(f"New client connection from {peer} accepted.")
 
     # Keep connection alive until error or client disconnects
@@ -70,7 +70,7 @@ async def handle_client(reader: asyncio.StreamReader, writer: asyncio.StreamWrit
         try:
             # Read header first (5 bytes: cmd_type + name_len + client_id_len)
             header = await reader.readexactly(CMD_HEADER_SIZE)
-            cmd_type, name_len, client_id_len = struct.unpack(CMD_FORMAT, header)
+            cmd_type, name_len, client_id_len = CMD_STRUCT.unpack(header)
 
             # Read name and client_id
             data = await reader.readexactly(name_len + client_id_len)
@@ -143,7 +143,7 @@ async def shutdown(signal: signal.Signals, loop: asyncio.AbstractEventLoop) -> N
     await asyncio.gather(*tasks, return_exceptions=True)
     loop.stop()
 
-async def main(host: str, port: int, verbose: bool = False) -> None:
+async def main(host: str, port: int, verbose: bool = False, unix_path: Optional[str] = None) -> None:
     """Main server function."""
     if verbose:
         logger.setLevel(logging.DEBUG)
@@ -161,6 +161,15 @@ async def main(host: str, port: int, verbose: bool = False) -> None:
             logger.error(f"Failed to bind to port {port}: {e}")
             sys.exit(1)
 
+        # Optionally also listen on a unix socket for clients on this host
+        unix_server = None
+        if unix_path:
+            try:
+                unix_server = await asyncio.start_unix_server(handle_client, path=unix_path)
+            except OSError as e:
+                logger.error(f"Failed to bind to unix socket {unix_path}: {e}")
+                sys.exit(1)
+
         # Start cleanup task
         cleanup_task = asyncio.create_task(cleanup_stale_locks())
 
@@ -168,8 +177,12 @@ async def main(host: str, port: int, verbose: bool = False) -> None:
         async with server:
             addr = server.sockets[0].getsockname()
             logger.info(f"distlockd server running on {addr[0]}:{addr[1]}")
+            serving = [server.serve_forever()]
+            if unix_server:
+                logger.info(f"distlockd server running on unix socket {unix_path}")
+                serving.append(unix_server.serve_forever())
             try:
-                await server.serve_forever()
+                await asyncio.gather(*serving)
             except asyncio.CancelledError:
                 logger.info("Server shutdown initiated")
 
@@ -177,6 +190,14 @@ async def main(host: str, port: int, verbose: bool = False) -> None:
         logger.error(f"Server error: {str(e)}", exc_info=True)
         sys.exit(1)
     finally:
+        if 'unix_server' in locals() and unix_server:
+            unix_server.close()
+            # asyncio does not remove the socket file on close
+            try:
+                os.unlink(unix_path)
+            except OSError:
+                pass
+            await unix_server.wait_closed()
         if 'cleanup_task' in locals():
             cleanup_task.cancel()
             try:
@@ -26,6 +26,9 @@ setup(
     ],
     python_requires=">=3.7",
     install_requires=[],
+    extras_require={
+        'uvloop': ['uvloop'],
+    },
     entry_points={
         'console_scripts': [
             'distlockd=distlockd.cli:main',